@@ -0,0 +1,128 @@
+import time
+import numpy as np
+import pandas as pd
+
+# Synthetic market data for the benchmarks. Everything is seeded so runs are
+# comparable across commits.
+
+CANDLES = 250  # Same as the scan in main.py
+TIMEFRAME_MS = 4 * 60 * 60 * 1000
+
+
+def make_symbols(count):
+    return [f"SYM{i:04d}/USDT" for i in range(count)]
+
+
+def make_ohlcv_rows(seed, candles=CANDLES):
+    """Random-walk OHLCV rows in ccxt format: [timestamp, open, high, low, close, volume]."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0.0005, 0.02, candles)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.01, candles)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.uniform(1e4, 1e6, candles)
+    start = 1_700_000_000_000
+    timestamps = start + np.arange(candles) * TIMEFRAME_MS
+    return [list(row) for row in zip(timestamps.tolist(), open_, high, low, close, volume)]
+
+
+def make_ohlcv(seed, candles=CANDLES):
+    """Same data as make_ohlcv_rows, as the DataFrame MarketData.fetch_ohlcv returns."""
+    df = pd.DataFrame(make_ohlcv_rows(seed, candles), columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+    return df
+
+
+def make_positions(count, seed=0):
+    """Open positions as stored by PositionManager, plus a matching current_data dict."""
+    rng = np.random.default_rng(seed)
+    positions = []
+    current_data = {}
+    for i, symbol in enumerate(make_symbols(count)):
+        entry = float(rng.uniform(1, 100))
+        risk = entry * 0.04
+        positions.append({
+            'symbol': symbol,
+            'entry_time': '2024-01-01T00:00:00',
+            'entry_price': entry,
+            'size': 10.0,
+            'initial_size': 10.0,
+            'stop_loss': entry - risk,
+            'tp1': entry + risk,
+            'tp2': entry + risk * 1.5,
+            'tp3': entry + risk * 2.0,
+            'tp1_hit': False,
+            'tp2_hit': False,
+            'current_pl': 0.0,
+            'notes': 'Open'
+        })
+        # Mostly quiet prices; roughly 1 in 10 positions hits TP1 or the stop
+        move = float(rng.choice([0.0, 0.01, -0.01, 0.05, -0.05], p=[0.3, 0.3, 0.3, 0.05, 0.05]))
+        price = entry * (1 + move)
+        current_data[symbol] = {'close': price, 'high': price, 'low': price}
+    return positions, current_data
+
+
+def make_open_positions(exchange, count):
+    """
+    Positions on the first `count` symbols of a FakeExchange, entered at the
+    current price so the monitor step checks them without closing them.
+    """
+    positions, _ = make_positions(count)
+    for pos in positions:
+        entry = exchange.fetch_tickers([pos['symbol']])[pos['symbol']]['last']
+        risk = entry * 0.04
+        pos.update({
+            'entry_price': entry,
+            'stop_loss': entry - risk,
+            'tp1': entry + risk,
+            'tp2': entry + risk * 1.5,
+            'tp3': entry + risk * 2.0,
+        })
+    return positions
+
+
+class FakeExchange:
+    """
+    Stand-in for ccxt.bybit serving synthetic markets, tickers and candles
+    without network access.
+    """
+
+    precisionMode = 4  # ccxt.TICK_SIZE, as for Bybit
+
+    def __init__(self, symbols, candles=CANDLES):
+        self.symbols = list(symbols)
+        self.candles = candles
+        self.last_response_headers = {}
+        self._ohlcv = {symbol: make_ohlcv_rows(i, candles) for i, symbol in enumerate(self.symbols)}
+        self.markets = {
+            symbol: {
+                'symbol': symbol,
+                'precision': {'amount': 0.001},
+                'limits': {'amount': {'min': 0.001}, 'cost': {'min': 5.0}},
+            }
+            for symbol in self.symbols
+        }
+
+    def load_markets(self, reload=False):
+        return self.markets
+
+    def fetch_tickers(self, symbols=None):
+        symbols = self.symbols if symbols is None else symbols
+        tickers = {}
+        for symbol in symbols:
+            last = self._ohlcv[symbol][-1][4] if symbol in self._ohlcv else 1.0
+            tickers[symbol] = {
+                'symbol': symbol,
+                'last': last,
+                'high': last,
+                'low': last,
+                'quoteVolume': 5e6,
+                'timestamp': int(time.time() * 1000),
+            }
+        return tickers
+
+    def fetch_ohlcv(self, symbol, timeframe=None, since=None, limit=None):
+        rows = self._ohlcv[symbol]
+        return rows[-limit:] if limit else rows
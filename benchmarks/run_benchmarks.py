@@ -0,0 +1,246 @@
+"""
+Benchmarks for the scan and monitor cycles.
+
+Times the hot paths on synthetic data for 10, 100 and 1000 symbols, appends
+the results to a JSON history file and exits non-zero if any benchmark got
+slower than the recent baseline by more than the threshold.
+
+Usage:
+    python3 benchmarks/run_benchmarks.py [--sizes 10 100 1000] [--repeat 3]
+                                         [--threshold 0.25] [--history FILE]
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import types
+from datetime import datetime
+from unittest import mock
+
+# Add project root's parent to sys.path so the 'crypto_bot' package is found (same as main.py)
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.dirname(REPO_DIR))
+
+DEFAULT_SIZES = [10, 100, 1000]
+DEFAULT_HISTORY = os.path.join(REPO_DIR, 'logs', 'benchmark_history.json')
+
+
+class _StopLoop(BaseException):
+    """Raised from the patched time.sleep to leave main()'s loop (not caught by its except Exception)."""
+
+
+def timed(func, setup=None, repeat=3):
+    """Best wall time of `repeat` runs of func(setup())."""
+    best = float('inf')
+    for _ in range(repeat):
+        arg = setup() if setup else None
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmarks(sizes, repeat, workdir):
+    # Imported here: the bot's loggers create logs/ relative to the working directory
+    import ccxt
+    from crypto_bot.config import Config
+    from crypto_bot.strategy.indicators import Indicators
+    from crypto_bot.strategy.signal_generator import SignalGenerator
+    from crypto_bot.strategy.trade_manager import TradeManager
+    from crypto_bot.execution.position_manager import PositionManager
+    from crypto_bot.telegram.notifier import TelegramNotifier
+    from crypto_bot import main as main_module
+    from crypto_bot.benchmarks.fixtures import FakeExchange, make_ohlcv, make_open_positions, make_positions, make_symbols
+
+    Config.PARAMS_FILE = os.path.join(workdir, 'trade_params.json')
+    Config.CSV_FILE = os.path.join(workdir, 'logs', 'trade_history.csv')
+
+    def reset_state():
+        if os.path.exists(Config.PARAMS_FILE):
+            os.remove(Config.PARAMS_FILE)
+
+    signal_gen = SignalGenerator()
+    trade_manager = TradeManager()
+    columns = signal_gen.required_columns | {'atr'}
+
+    results = {}
+    with mock.patch.object(TelegramNotifier, 'send_message', lambda self, message: None):
+        for size in sizes:
+            raw = [make_ohlcv(seed) for seed in range(size)]
+            with_indicators = [Indicators.add_indicators(df.copy(), columns) for df in raw]
+
+            results[f'indicators.add_indicators[{size}]'] = timed(
+                lambda frames: [Indicators.add_indicators(df, columns) for df in frames],
+                setup=lambda: [df.copy() for df in raw],
+                repeat=repeat,
+            )
+
+            results[f'signal_generator.check_entry_signal[{size}]'] = timed(
+                lambda _: [signal_gen.check_entry_signal(df) for df in with_indicators],
+                repeat=repeat,
+            )
+
+            results[f'trade_manager.calculate_trade_params[{size}]'] = timed(
+                lambda _: [trade_manager.calculate_trade_params(df, df['close'].iat[-1], Config.VIRTUAL_CAPITAL)
+                           for df in with_indicators],
+                repeat=repeat,
+            )
+
+            def position_manager_with_positions():
+                reset_state()
+                manager = PositionManager()
+                manager.positions, current_data = make_positions(size)
+                return manager, current_data
+
+            results[f'position_manager.check_positions[{size}]'] = timed(
+                lambda args: args[0].check_positions(args[1]),
+                setup=position_manager_with_positions,
+                repeat=repeat,
+            )
+
+            def exchange_with_open_positions():
+                # Seed positions below MAX_OPEN_POSITIONS so one iteration runs both the monitor and the scan
+                exchange = FakeExchange(make_symbols(size))
+                count = max(0, min(size, Config.MAX_OPEN_POSITIONS - 1))
+                with open(Config.PARAMS_FILE, 'w') as f:
+                    json.dump({'positions': make_open_positions(exchange, count), 'capital': Config.VIRTUAL_CAPITAL}, f)
+                return exchange
+
+            results[f'main.iteration[{size}]'] = timed(
+                lambda exchange: _run_main_iteration(main_module, exchange, ccxt),
+                setup=exchange_with_open_positions,
+                repeat=repeat,
+            )
+
+    return results
+
+
+def _run_main_iteration(main_module, exchange, ccxt):
+    """Run one pass of main.main()'s loop (monitor + scan) against a fake exchange."""
+    def stop(seconds):
+        raise _StopLoop()
+
+    def fail(message):
+        # main() logs and swallows errors; a benchmark of a failing loop is meaningless
+        raise RuntimeError(f"main loop error during benchmark: {message}")
+
+    fake_time = types.SimpleNamespace(time=time.time, sleep=stop)
+    with mock.patch.object(ccxt, 'bybit', lambda config: exchange), \
+            mock.patch.object(main_module, 'time', fake_time), \
+            mock.patch.object(main_module.logger, 'error', fail), \
+            mock.patch.object(main_module.Config, 'validate', lambda: None):
+        try:
+            main_module.main()
+        except _StopLoop:
+            pass
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def save_history(path, history):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(history, f, indent=4)
+
+
+def environment():
+    """Identifies where timings were taken; only runs from the same environment are compared."""
+    return {
+        'host': platform.node(),
+        'machine': platform.machine(),
+        'python': platform.python_version(),
+    }
+
+
+def find_regressions(results, history, threshold, baseline_runs, env):
+    """
+    Compare against the median of the last `baseline_runs` runs from the same
+    environment, regressed or not, so an accepted slowdown becomes the new
+    baseline after a few runs.
+    Returns {name: (baseline, current)} for benchmarks slower than baseline * (1 + threshold).
+    """
+    same_env = [run for run in history if all(run.get(key) == value for key, value in env.items())]
+    recent = same_env[-baseline_runs:]
+    regressions = {}
+    for name, current in results.items():
+        previous = [run['results'][name] for run in recent if name in run['results']]
+        if not previous:
+            continue
+        baseline = statistics.median(previous)
+        if current > baseline * (1 + threshold):
+            regressions[name] = (baseline, current)
+    return regressions
+
+
+def _git_commit():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the scan and monitor cycles.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Symbol counts to benchmark")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per benchmark (best time is kept)")
+    parser.add_argument('--threshold', type=float, default=0.25, help="Allowed slowdown vs baseline (0.25 = 25%%)")
+    parser.add_argument('--baseline-runs', type=int, default=5, help="Recent runs (same host/machine/python) the baseline median is taken over")
+    parser.add_argument('--history', default=DEFAULT_HISTORY, help="JSON file results are appended to")
+    parser.add_argument('--no-record', action='store_true', help="Compare only, do not append to the history")
+    args = parser.parse_args(argv)
+
+    history_path = os.path.abspath(args.history)
+    history = load_history(history_path)
+
+    # Bot logs every pair at INFO; keep the output to the results
+    logging.disable(logging.INFO)
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as workdir:
+        os.chdir(workdir)
+        try:
+            results = run_benchmarks(args.sizes, args.repeat, workdir)
+        finally:
+            os.chdir(cwd)
+
+    env = environment()
+    regressions = find_regressions(results, history, args.threshold, args.baseline_runs, env)
+
+    for name, seconds in results.items():
+        flag = ""
+        if name in regressions:
+            baseline, _ = regressions[name]
+            flag = f"  REGRESSION (baseline {baseline * 1000:.2f} ms, +{(seconds / baseline - 1) * 100:.0f}%)"
+        print(f"{name:<50} {seconds * 1000:>10.2f} ms{flag}")
+
+    if not args.no_record:
+        history.append({
+            'date': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            **env,
+            'results': results,
+            'regressions': sorted(regressions),
+        })
+        save_history(history_path, history)
+        print(f"Results appended to {history_path}")
+
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than {args.threshold * 100:.0f}%")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
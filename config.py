@@ -1,8 +1,39 @@
+import math
 import os
-from dotenv import load_dotenv
+import signal
+from dotenv import load_dotenv, find_dotenv, dotenv_values
+
+# Environment as it was before .env was loaded; real environment variables win over .env
+_PROCESS_ENV = dict(os.environ)
 
 # Load environment variables
-load_dotenv()
+ENV_FILE = find_dotenv() or os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+load_dotenv(ENV_FILE)
+
+def _default_entry_rule(ema_long, ema_medium, ema_short):
+    return f"close > ema_{ema_long} & cross_above(ema_{ema_short}, ema_{ema_medium}) & macd > macd_signal"
+
+# Settings that can be overridden in .env and reloaded at runtime: name -> (type, check)
+RELOADABLE_SETTINGS = {
+    'MAX_OPEN_POSITIONS': (int, lambda v: v >= 0),
+    'RISK_PER_TRADE_PERCENT': (float, lambda v: 0 < v <= 0.1),
+    'MAX_DAILY_LOSS_PERCENT': (float, lambda v: 0 < v <= 1),
+    'EMA_LONG': (int, lambda v: v >= 2),
+    'EMA_MEDIUM': (int, lambda v: v >= 2),
+    'EMA_SHORT': (int, lambda v: v >= 2),
+    'ATR_PERIOD': (int, lambda v: v >= 1),
+    'ATR_MULTIPLIER': (float, lambda v: v > 0),
+    'ENTRY_RULE': (str, lambda v: bool(v.strip())),  # Compiled by the validator in strategy/signal_generator.py
+    'EXCHANGE_MAX_RETRIES': (int, lambda v: v >= 0),
+    'CIRCUIT_BREAKER_THRESHOLD': (int, lambda v: v >= 1),
+    'CIRCUIT_BREAKER_COOLDOWN': (float, lambda v: v >= 0),
+    'MIN_DAILY_VOLUME_USDT': (float, lambda v: v >= 0),
+    'OHLCV_LIMIT': (int, lambda v: v >= 1),
+}
+
+# Extra checks on the full settings dict, added by the modules that consume them
+# (keeps config.py free of strategy imports). Each raises ValueError if invalid.
+SETTINGS_VALIDATORS = []
 
 class Config:
     # Bybit API
@@ -11,6 +42,7 @@ class Config:
     
     # Trading Settings
     TIMEFRAME = '4h'
+    OHLCV_LIMIT = 250  # Candles fetched per pair in a scan; must cover the longest EMA
     SYMBOL_TYPE = 'future'  # or 'spot' - usually bots trade futures for shorting, user asked for USDT pairs, likely spot or futures. 
                             # User mentioned "Trend-following with 2 positions maximum", usually implies leverage/margin or just spot.
                             # "USDT pairs" usually implies Futures if shorting is needed, strategies involve "bullish" and "bearish".
@@ -31,6 +63,15 @@ class Config:
     ATR_PERIOD = 14
     ATR_MULTIPLIER = 2.0
     
+    # Entry Rule (see strategy/rules.py for the syntax)
+    # Trend: Close > EMA 200, Momentum: EMA 10 crosses above EMA 55, Confirmation: MACD > Signal
+    ENTRY_RULE = _default_entry_rule(EMA_LONG, EMA_MEDIUM, EMA_SHORT)
+    
+    # Exchange Client (retries, circuit breaker)
+    EXCHANGE_MAX_RETRIES = 3
+    CIRCUIT_BREAKER_THRESHOLD = 5  # Consecutive failed calls before an endpoint is paused
+    CIRCUIT_BREAKER_COOLDOWN = 60  # Seconds
+    
     # Volume Filter
     MIN_DAILY_VOLUME_USDT = 1000000
     
@@ -49,3 +90,113 @@ class Config:
             print("WARNING: Bybit API Keys not found in .env. Order execution will fail.")
         if not Config.TELEGRAM_BOT_TOKEN or not Config.TELEGRAM_CHAT_ID:
             print("WARNING: Telegram credentials not found. Notifications disabled.")
+
+    @staticmethod
+    def load_settings():
+        """
+        Read and validate the reloadable settings from .env (environment variables win).
+        Returns {name: value} for every reloadable setting; unset ones keep their defaults.
+        Raises ValueError describing every invalid value.
+        """
+        source = dotenv_values(ENV_FILE) if os.path.exists(ENV_FILE) else {}
+        source.update({k: v for k, v in _PROCESS_ENV.items() if k in RELOADABLE_SETTINGS})
+
+        settings = {}
+        errors = []
+        for name, (type_, check) in RELOADABLE_SETTINGS.items():
+            if name == 'ENTRY_RULE':
+                continue
+            raw = source.get(name)
+            if raw is None or raw == '':
+                settings[name] = _DEFAULTS[name]
+                continue
+            try:
+                value = type_(raw)
+                if type_ is float and not math.isfinite(value):
+                    raise ValueError("not a finite number")
+                if not check(value):
+                    raise ValueError("out of range")
+                settings[name] = value
+            except ValueError as e:
+                errors.append(f"{name}={raw!r} ({e})")
+
+        if not errors and not settings['EMA_SHORT'] < settings['EMA_MEDIUM'] < settings['EMA_LONG']:
+            errors.append("EMA lengths must satisfy EMA_SHORT < EMA_MEDIUM < EMA_LONG")
+
+        if not errors and settings['EMA_LONG'] > settings['OHLCV_LIMIT']:
+            errors.append(f"EMA_LONG={settings['EMA_LONG']} needs more candles than OHLCV_LIMIT={settings['OHLCV_LIMIT']}")
+
+        # Default rule follows the configured EMA lengths
+        rule = source.get('ENTRY_RULE') or _default_entry_rule(
+            settings.get('EMA_LONG'), settings.get('EMA_MEDIUM'), settings.get('EMA_SHORT'))
+        if not errors and not RELOADABLE_SETTINGS['ENTRY_RULE'][1](rule):
+            errors.append("ENTRY_RULE is empty")
+        settings['ENTRY_RULE'] = rule
+
+        if not errors:
+            for validator in SETTINGS_VALIDATORS:
+                try:
+                    validator(settings)
+                except ValueError as e:
+                    errors.append(str(e))
+
+        if errors:
+            raise ValueError("Invalid settings: " + "; ".join(errors))
+        return settings
+
+    @staticmethod
+    def reload():
+        """
+        Re-read the settings and apply them. All-or-nothing: if any value is
+        invalid a ValueError is raised and the current settings are kept.
+        Returns the set of setting names whose value changed.
+        """
+        settings = Config.load_settings()
+        changed = {name for name, value in settings.items() if getattr(Config, name) != value}
+        for name in changed:
+            setattr(Config, name, settings[name])
+        return changed
+
+    @staticmethod
+    def reload_if_changed():
+        """
+        Reload if the .env file was modified or a reload was requested by
+        signal since the last check. Returns the changed names (empty if none).
+        """
+        global _env_mtime, _reload_requested
+        try:
+            mtime = os.path.getmtime(ENV_FILE)
+        except OSError:
+            mtime = None
+
+        if mtime == _env_mtime and not _reload_requested:
+            return set()
+
+        # Mark as seen first so an invalid file is reported once, not every loop
+        _env_mtime = mtime
+        _reload_requested = False
+        return Config.reload()
+
+    @staticmethod
+    def add_settings_validator(validator):
+        """Register validator(settings) to run on every load; it raises ValueError to reject them."""
+        if validator not in SETTINGS_VALIDATORS:
+            SETTINGS_VALIDATORS.append(validator)
+
+    @staticmethod
+    def install_reload_signal():
+        """Reload settings on SIGHUP (e.g. `kill -HUP <pid>`), where supported."""
+        if hasattr(signal, 'SIGHUP'):
+            signal.signal(signal.SIGHUP, _request_reload)
+
+_DEFAULTS = {name: getattr(Config, name) for name in RELOADABLE_SETTINGS}
+_reload_requested = False
+
+def _request_reload(signum, frame):
+    global _reload_requested
+    _reload_requested = True
+
+try:
+    _env_mtime = os.path.getmtime(ENV_FILE)
+except OSError:
+    _env_mtime = None
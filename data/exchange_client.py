@@ -0,0 +1,300 @@
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+import ccxt
+from crypto_bot.config import Config
+from crypto_bot.utils.logger import setup_logger
+
+logger = setup_logger("ExchangeClient")
+
+# Retry policy per error class: (counter name, base backoff seconds).
+# Order matters: ccxt's RateLimitExceeded < DDoSProtection < NetworkError, etc.
+# Anything not listed (auth errors, bad symbols, other ExchangeErrors) is not retried.
+RETRY_POLICIES = [
+    (ccxt.RateLimitExceeded, 'rate_limited', 2.0),
+    (ccxt.DDoSProtection, 'rate_limited', 2.0),
+    (ccxt.RequestTimeout, 'timeout', 0.5),
+    (ccxt.ExchangeNotAvailable, 'unavailable', 2.0),
+    (ccxt.NetworkError, 'network_error', 1.0),
+]
+
+MAX_BACKOFF_SECONDS = 30.0
+
+# Bybit v5 rate-limit response headers
+HEADER_LIMIT = 'x-bapi-limit'
+HEADER_REMAINING = 'x-bapi-limit-status'
+HEADER_RESET = 'x-bapi-limit-reset-timestamp'
+
+
+class CircuitOpenError(ccxt.ExchangeNotAvailable):
+    """Raised without calling the exchange while an endpoint's breaker is open."""
+
+
+def _header(headers, name):
+    """Case-insensitive header lookup returning a float or None."""
+    if not headers:
+        return None
+    for key, value in headers.items():
+        if key.lower() == name:
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return None
+    return None
+
+
+class AdaptiveRateLimiter:
+    """
+    Spaces out requests to one endpoint.
+    The interval backs off on 429s, decays on success, and is stretched
+    to fit the remaining quota reported by Bybit's rate-limit headers.
+    """
+
+    def __init__(self, min_interval=0.0, max_interval=MAX_BACKOFF_SECONDS):
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.next_allowed = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until the next request slot. Returns the seconds waited."""
+        with self.lock:
+            now = time.monotonic()
+            wait = max(0.0, self.next_allowed - now)
+            self.next_allowed = max(now, self.next_allowed) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def on_success(self, headers=None):
+        with self.lock:
+            self.interval = max(self.min_interval, self.interval * 0.8)
+            self._apply_headers(headers)
+
+    def on_rate_limited(self, headers=None):
+        with self.lock:
+            self.interval = min(self.max_interval, max(self.interval * 2, 0.5))
+            self._apply_headers(headers)
+
+    def _apply_headers(self, headers):
+        limit = _header(headers, HEADER_LIMIT)
+        remaining = _header(headers, HEADER_REMAINING)
+        reset_ms = _header(headers, HEADER_RESET)
+        if limit is None or remaining is None or reset_ms is None:
+            return
+
+        until_reset = min(self.max_interval, max(0.0, reset_ms / 1000 - time.time()))
+        if remaining <= 0:
+            # Quota exhausted: hold everything until the window resets
+            self.next_allowed = max(self.next_allowed, time.monotonic() + until_reset)
+        elif remaining < limit * 0.2:
+            # Running low: spread the remaining quota over the rest of the window
+            self.interval = min(self.max_interval, max(self.interval, until_reset / remaining))
+
+
+class CircuitBreaker:
+    """
+    Opens after `threshold` consecutive failures and rejects calls for
+    `cooldown` seconds, then lets one trial call through (half-open).
+    """
+
+    def __init__(self, threshold, cooldown):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def allow(self):
+        with self.lock:
+            if self.opened_at is None:
+                return True
+            if time.monotonic() - self.opened_at >= self.cooldown:
+                # Half-open: allow a trial call, re-open on its failure
+                self.opened_at = None
+                self.failures = self.threshold - 1
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+
+    def record_failure(self):
+        """Returns True if this failure tripped the breaker."""
+        with self.lock:
+            self.failures += 1
+            if self.opened_at is None and self.failures >= self.threshold:
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class ExchangeClient:
+    """
+    Wrapper around a ccxt exchange adding per-endpoint adaptive rate limiting,
+    jittered retries by error class, circuit breaking and coalescing of
+    identical concurrent requests. `stats()` reports how often each path trips.
+    """
+
+    def __init__(self, exchange, max_retries=None, breaker_threshold=None, breaker_cooldown=None):
+        self.exchange = exchange
+        # Explicit arguments win over Config, including after settings reloads
+        self._overrides = {
+            'max_retries': max_retries,
+            'breaker_threshold': breaker_threshold,
+            'breaker_cooldown': breaker_cooldown,
+        }
+        self._apply_settings()
+
+        self.limiters = defaultdict(AdaptiveRateLimiter)
+        self.breakers = defaultdict(lambda: CircuitBreaker(self.breaker_threshold, self.breaker_cooldown))
+        self.counters = Counter()
+        self._counters_lock = threading.Lock()
+
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+
+    def _apply_settings(self):
+        overrides = self._overrides
+        self.max_retries = Config.EXCHANGE_MAX_RETRIES if overrides['max_retries'] is None else overrides['max_retries']
+        self.breaker_threshold = Config.CIRCUIT_BREAKER_THRESHOLD if overrides['breaker_threshold'] is None else overrides['breaker_threshold']
+        self.breaker_cooldown = Config.CIRCUIT_BREAKER_COOLDOWN if overrides['breaker_cooldown'] is None else overrides['breaker_cooldown']
+
+    def on_config_change(self, changed):
+        """Pick up reloaded retry/breaker settings, keeping limiter and breaker state."""
+        if not changed & {'EXCHANGE_MAX_RETRIES', 'CIRCUIT_BREAKER_THRESHOLD', 'CIRCUIT_BREAKER_COOLDOWN'}:
+            return
+        self._apply_settings()
+        for breaker in self.breakers.values():
+            breaker.threshold = self.breaker_threshold
+            breaker.cooldown = self.breaker_cooldown
+
+    def load_markets(self, reload=False):
+        return self.call('load_markets', reload)
+
+    def fetch_tickers(self, symbols=None):
+        return self.call('fetch_tickers', symbols)
+
+    def fetch_ohlcv(self, symbol, timeframe, limit=None):
+        return self.call('fetch_ohlcv', symbol, timeframe, limit=limit)
+
+    def call(self, endpoint, *args, **kwargs):
+        """
+        Call `exchange.<endpoint>(*args, **kwargs)`.
+        Identical calls already in flight on another thread share its result.
+        """
+        key = (endpoint, repr(args), repr(sorted(kwargs.items())))
+
+        with self._in_flight_lock:
+            pending = self._in_flight.get(key)
+            is_leader = pending is None
+            if is_leader:
+                pending = self._in_flight[key] = _InFlight()
+
+        if not is_leader:
+            self._count(endpoint, 'coalesced')
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        try:
+            pending.result = self._call_with_retries(endpoint, args, kwargs)
+            return pending.result
+        except Exception as e:
+            pending.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                self._in_flight.pop(key, None)
+            pending.done.set()
+
+    def _call_with_retries(self, endpoint, args, kwargs):
+        breaker = self.breakers[endpoint]
+        limiter = self.limiters[endpoint]
+
+        if not breaker.allow():
+            self._count(endpoint, 'circuit_rejected')
+            raise CircuitOpenError(f"Circuit open for {endpoint}, retrying after {self.breaker_cooldown}s cooldown")
+
+        attempt = 0
+        while True:
+            if limiter.acquire() > 0:
+                self._count(endpoint, 'throttled')
+            self._count(endpoint, 'requests')
+            try:
+                result = getattr(self.exchange, endpoint)(*args, **kwargs)
+            except Exception as e:
+                policy = self._retry_policy(e)
+                if policy is None:
+                    # Not transient (bad symbol, auth, ...): no retry, not the endpoint's fault
+                    self._count(endpoint, 'errors')
+                    raise
+
+                name, base_delay = policy
+                self._count(endpoint, name)
+                if name == 'rate_limited':
+                    limiter.on_rate_limited(self._last_headers())
+
+                if attempt >= self.max_retries:
+                    self._count(endpoint, 'errors')
+                    if breaker.record_failure():
+                        self._count(endpoint, 'circuit_opened')
+                        logger.warning(f"Circuit opened for {endpoint} after {breaker.failures} consecutive failures")
+                    raise
+
+                # Full jitter exponential backoff
+                delay = random.uniform(0, min(MAX_BACKOFF_SECONDS, base_delay * 2 ** attempt))
+                attempt += 1
+                self._count(endpoint, 'retries')
+                logger.warning(f"{endpoint} failed ({type(e).__name__}: {e}). Retry {attempt}/{self.max_retries} in {delay:.1f}s")
+                time.sleep(delay)
+                continue
+
+            limiter.on_success(self._last_headers())
+            breaker.record_success()
+            return result
+
+    @staticmethod
+    def _retry_policy(error):
+        for error_class, name, base_delay in RETRY_POLICIES:
+            if isinstance(error, error_class):
+                return name, base_delay
+        return None
+
+    def _last_headers(self):
+        return getattr(self.exchange, 'last_response_headers', None)
+
+    def _count(self, endpoint, event):
+        with self._counters_lock:
+            self.counters[(endpoint, event)] += 1
+
+    def stats(self):
+        """Counters per endpoint, e.g. {'fetch_ohlcv': {'requests': 30, 'retries': 1}}."""
+        with self._counters_lock:
+            counters = sorted(self.counters.items())
+        result = defaultdict(dict)
+        for (endpoint, event), count in counters:
+            result[endpoint][event] = count
+        return dict(result)
+
+    def format_stats(self):
+        return "; ".join(
+            f"{endpoint}: " + ", ".join(f"{event}={count}" for event, count in events.items())
+            for endpoint, events in self.stats().items()
+        )
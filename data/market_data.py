@@ -2,6 +2,7 @@ import ccxt
 import pandas as pd
 import time
 from crypto_bot.config import Config
+from crypto_bot.data.exchange_client import ExchangeClient
 from crypto_bot.utils.logger import setup_logger
 
 logger = setup_logger("MarketData")
@@ -22,17 +23,21 @@ class MarketData:
             config_args['secret'] = Config.BYBIT_SECRET_KEY
             
         self.exchange = ccxt.bybit(config_args)
+        self.client = ExchangeClient(self.exchange)
+        
+        # symbol -> lot limits, filled lazily from the exchange market metadata
+        self._market_limits = {}
         
     def fetch_high_volume_pairs(self, limit=50):
         """
         Fetch all USDT pairs and filter by volume.
         """
         try:
-            markets = self.exchange.load_markets()
+            markets = self.client.load_markets()
             symbols = []
             
             # Get tickers to check volume
-            tickers = self.exchange.fetch_tickers()
+            tickers = self.client.fetch_tickers()
             
             # Stablecoins to exclude
             stablecoins = ['USDC', 'USDE', 'DAI', 'BUSD', 'TUSD', 'USDT', 'FDUSD', 'USDP', 'GUSD', 'STABLE', 'XAUT']
@@ -58,7 +63,7 @@ class MarketData:
             return symbols
             
         except Exception as e:
-            logger.error(f"Error fetching markets: {e}")
+            logger.error(f"Error fetching markets ({type(e).__name__}): {e}")
             return []
             
     def fetch_ohlcv(self, symbol, limit=100):
@@ -67,16 +72,57 @@ class MarketData:
         """
         try:
             # fetch_ohlcv(symbol, timeframe, since, limit)
-            ohlcv = self.exchange.fetch_ohlcv(symbol, Config.TIMEFRAME, limit=limit)
+            ohlcv = self.client.fetch_ohlcv(symbol, Config.TIMEFRAME, limit=limit)
             
             df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
             
             return df
         except Exception as e:
-            logger.error(f"Error fetching OHLCV for {symbol}: {e}")
+            logger.error(f"Error fetching OHLCV for {symbol} ({type(e).__name__}): {e}")
             return pd.DataFrame()
     
+    def fetch_tickers(self, symbols=None):
+        """
+        Fetch tickers for the given symbols (all if None).
+        Errors are raised after the client's retries are exhausted.
+        """
+        return self.client.fetch_tickers(symbols)
+    
+    def get_market_limits(self, symbol):
+        """
+        Lot size and minimum order limits for a symbol, cached per symbol.
+        Returns a dict with 'amount_step', 'min_amount', 'min_notional'
+        (None where the exchange does not report a limit).
+        """
+        if symbol in self._market_limits:
+            return self._market_limits[symbol]
+        
+        try:
+            # load_markets() is cached by ccxt after the first call
+            market = self.client.load_markets().get(symbol)
+        except Exception as e:
+            logger.error(f"Error loading market metadata for {symbol}: {e}")
+            return {}
+        
+        if market is None:
+            return {}
+        
+        precision = market.get('precision') or {}
+        limits = market.get('limits') or {}
+        amount_step = precision.get('amount')
+        
+        # Bybit uses ccxt TICK_SIZE precision mode (step sizes); older modes give decimal places
+        if amount_step is not None and self.exchange.precisionMode != ccxt.TICK_SIZE:
+            amount_step = 10 ** -amount_step
+        
+        self._market_limits[symbol] = {
+            'amount_step': amount_step,
+            'min_amount': (limits.get('amount') or {}).get('min'),
+            'min_notional': (limits.get('cost') or {}).get('min'),
+        }
+        return self._market_limits[symbol]
+    
     def _save_pairs_to_file(self, symbols):
         """
         Save pairs to a file and detect new pairs.
@@ -20,6 +20,13 @@ def main():
     logger.info("Starting Crypto Trading Bot...")
     Config.validate()
     
+    # Apply .env overrides before building components, then watch for changes
+    try:
+        Config.reload()
+    except ValueError as e:
+        logger.error(f"{e}. Using default settings.")
+    Config.install_reload_signal()
+    
     # Initialize Components
     market_data = MarketData()
     indicators = Indicators()
@@ -37,6 +44,18 @@ def main():
         try:
             current_time = time.time()
             
+            # 0. Pick up settings changes (.env edited or SIGHUP) without restarting
+            try:
+                changed = Config.reload_if_changed()
+            except ValueError as e:
+                logger.error(f"{e}. Keeping previous settings.")
+                changed = set()
+            
+            if changed:
+                logger.info(f"Settings reloaded: {', '.join(sorted(changed))}")
+                signal_gen.on_config_change(changed)
+                market_data.client.on_config_change(changed)
+            
             # 1. Monitor Open Positions
             if pos_manager.positions:
                 logger.info(f"Monitoring {len(pos_manager.positions)} active positions...")
@@ -49,7 +68,7 @@ def main():
                 # Fetching one by one or batch? ccxt fetch_tickers works for batch usually or all.
                 # fetch_tickers(symbols) is supported by binance
                 try:
-                    tickers = market_data.exchange.fetch_tickers(active_symbols)
+                    tickers = market_data.fetch_tickers(active_symbols)
                     # Convert to required format
                     current_data = {}
                     for sym, ticker in tickers.items():
@@ -95,18 +114,18 @@ def main():
                         logger.info(f"[{idx}/{len(pairs)}] {pair} - Fetching data...")
                         
                         # Fetch Data
-                        df = market_data.fetch_ohlcv(pair, limit=250)
+                        df = market_data.fetch_ohlcv(pair, limit=Config.OHLCV_LIMIT)
                         if df.empty:
                             logger.info(f"[{idx}/{len(pairs)}] {pair} - ❌ No data available")
                             continue
                         
                         logger.info(f"[{idx}/{len(pairs)}] {pair} - Calculating indicators...")
                         
-                        # Indicators
-                        df = indicators.add_indicators(df)
+                        # Indicators (only what the entry rule and trade sizing need)
+                        df = indicators.add_indicators(df, columns=signal_gen.required_columns | {'atr'})
                         
                         # Check if indicators were calculated successfully
-                        if 'ema_200' not in df.columns or df['ema_200'].isna().all():
+                        if not signal_gen.has_indicators(df):
                             logger.info(f"[{idx}/{len(pairs)}] {pair} - ❌ Insufficient data for indicators")
                             continue
                         
@@ -136,12 +155,23 @@ def main():
                         # Use last close as entry price or current price?
                         entry_price = df.iloc[-1]['close']
                         
-                        params = trade_manager.calculate_trade_params(df, entry_price, pos_manager.capital)
+                        limits = market_data.get_market_limits(pair)
+                        params = trade_manager.calculate_trade_params(df, entry_price, pos_manager.capital, limits)
                         
                         if params['size'] > 0:
                             pos_manager.open_position(pair, params)
+                        else:
+                            # Size before exchange lot rounding, to tell lot limits apart from an invalid stop
+                            raw_size = trade_manager.calculate_trade_params(df, entry_price, pos_manager.capital)['size']
+                            logger.info(
+                                f"{pair} - BUY signal skipped: size {raw_size:.8f} at {entry_price} is 0 after lot limits "
+                                f"(step={limits.get('amount_step')}, min_amount={limits.get('min_amount')}, "
+                                f"min_notional={limits.get('min_notional')})"
+                            )
                 else:
                     logger.info("Max positions reached. Skipping scan.")
+                
+                logger.info(f"Exchange client stats: {market_data.client.format_stats()}")
 
             # Sleep
             time.sleep(MONITOR_INTERVAL_SECONDS)
@@ -1,47 +1,100 @@
+import re
 import pandas as pd
 import pandas_ta as ta
 from crypto_bot.config import Config
 
+MACD_FAST = 12
+MACD_SLOW = 26
+MACD_SIGNAL = 9
+
+# 'ema_<length>' with a positive length and no leading zeros, so each EMA has one column name
+EMA_COLUMN_RE = re.compile(r'ema_([1-9]\d*)')
+
 class Indicators:
+    # Raw OHLCV columns, always present after MarketData.fetch_ohlcv
+    PRICE_COLUMNS = frozenset({'open', 'high', 'low', 'close', 'volume'})
+
+    # Short rule names -> pandas_ta MACD column names
+    MACD_COLUMNS = {
+        'macd': f'MACD_{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}',
+        'macd_signal': f'MACDs_{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}',
+        'macd_hist': f'MACDh_{MACD_FAST}_{MACD_SLOW}_{MACD_SIGNAL}',
+    }
+
     @staticmethod
-    def add_indicators(df):
+    def default_columns():
+        """
+        Columns computed when no explicit list is given:
+        the three configured EMAs, MACD and ATR.
         """
-        Add EMA 200, 55, 10, MACD, ATR to the dataframe.
+        return {
+            f'ema_{Config.EMA_LONG}',
+            f'ema_{Config.EMA_MEDIUM}',
+            f'ema_{Config.EMA_SHORT}',
+            *Indicators.MACD_COLUMNS,
+            'atr',
+        }
+
+    @staticmethod
+    def column_name(name):
+        """Map a rule column name (e.g. 'macd_signal') to the dataframe column."""
+        return Indicators.MACD_COLUMNS.get(name, name)
+
+    @staticmethod
+    def is_supported(name):
+        """True if `name` is a price column or an indicator add_indicators can compute."""
+        return (name in Indicators.PRICE_COLUMNS or name in Indicators.MACD_COLUMNS
+                or name == 'atr' or EMA_COLUMN_RE.fullmatch(name) is not None)
+
+    @staticmethod
+    def add_indicators(df, columns=None):
+        """
+        Add indicator columns to the dataframe.
+        `columns` is a collection of names such as 'ema_200', 'macd',
+        'macd_signal', 'atr'; only those are computed (each once).
+        Defaults to EMA 200, 55, 10, MACD and ATR.
         """
         if df.empty:
             return df
-            
-        # EMAs
-        # EMAs
-        # EMAs
+
+        if columns is None:
+            columns = Indicators.default_columns()
+
+        ema_columns = {}
+        need_macd = False
+        need_atr = False
+        for name in columns:
+            if name in Indicators.PRICE_COLUMNS:
+                continue
+            match = EMA_COLUMN_RE.fullmatch(name)
+            if match:
+                ema_columns[name] = int(match.group(1))
+            elif name in Indicators.MACD_COLUMNS:
+                need_macd = True
+            elif name == 'atr':
+                need_atr = True
+            else:
+                raise ValueError(f"Unknown indicator column '{name}'")
+
         # EMAs
         # Calculate separately and assign to avoid ambiguity and ensure naming
-        ema_200 = df.ta.ema(length=Config.EMA_LONG)
-        if isinstance(ema_200, pd.DataFrame): ema_200 = None  # Invalid result
-        
-        ema_55 = df.ta.ema(length=Config.EMA_MEDIUM)
-        if isinstance(ema_55, pd.DataFrame): ema_55 = None
-        
-        ema_10 = df.ta.ema(length=Config.EMA_SHORT)
-        if isinstance(ema_10, pd.DataFrame): ema_10 = None
-        
-        # Assign explicitly
-        if ema_200 is not None: df['ema_200'] = ema_200
-        if ema_55 is not None: df['ema_55'] = ema_55
-        if ema_10 is not None: df['ema_10'] = ema_10
-        
+        for name, length in sorted(ema_columns.items(), key=lambda item: -item[1]):
+            ema = df.ta.ema(length=length)
+            if isinstance(ema, pd.DataFrame): ema = None  # Invalid result
+            if ema is not None: df[name] = ema
+
         # MACD
         # pandas_ta macd returns columns likes MACD_12_26_9, MACDh_12_26_9, MACDs_12_26_9
-        # separating them for clarity
-        macd = df.ta.macd(fast=12, slow=26, signal=9)
-        if macd is not None:
-             df = pd.concat([df, macd], axis=1)
-             # Rename for easier access if needed, but standard names are fine.
-             # MACD_12_26_9 is the MACD line
-             # MACDs_12_26_9 is the Signal line
-             # MACDh_12_26_9 is the Histogram
-        
+        # MACD_12_26_9 is the MACD line
+        # MACDs_12_26_9 is the Signal line
+        # MACDh_12_26_9 is the Histogram
+        if need_macd:
+            macd = df.ta.macd(fast=MACD_FAST, slow=MACD_SLOW, signal=MACD_SIGNAL)
+            if macd is not None:
+                df = pd.concat([df, macd], axis=1)
+
         # ATR
-        df['atr'] = df.ta.atr(length=Config.ATR_PERIOD)
-        
+        if need_atr:
+            df['atr'] = df.ta.atr(length=Config.ATR_PERIOD)
+
         return df
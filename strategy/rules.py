@@ -0,0 +1,302 @@
+import re
+import numpy as np
+import pandas as pd
+from crypto_bot.strategy.indicators import Indicators
+
+# Tiny rule language for entry conditions, e.g.
+#     cross_above(ema_10, ema_55) & close > ema_200 & macd > macd_signal
+#
+# Rules are compiled once into a tree of NumPy closures and evaluated over
+# whole columns, so the same rule drives both the live scan (last row) and
+# backtests (every row).
+#
+# Precedence (lowest to highest): |, &, ~, comparisons, + -, * /, unary -.
+# Unlike Python, '&' and '|' bind looser than comparisons, so the example
+# above needs no extra parentheses.
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+\.\d*|\.\d+|\d+)
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<op>>=|<=|==|!=|[<>&|~()+\-*/,])
+    )""", re.VERBOSE)
+
+_COMPARISONS = {
+    '>': np.greater,
+    '<': np.less,
+    '>=': np.greater_equal,
+    '<=': np.less_equal,
+    '==': np.equal,
+    '!=': np.not_equal,
+}
+
+_ARITHMETIC = {
+    '+': np.add,
+    '-': np.subtract,
+    '*': np.multiply,
+    '/': np.divide,
+}
+
+
+class RuleError(ValueError):
+    """Raised when a rule expression cannot be parsed."""
+
+
+def _prev(values, periods=1):
+    """Shift an array forward by `periods`, padding the start with NaN."""
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 0:
+        # A constant's previous value is itself (e.g. the 0 in cross_above(macd_hist, 0))
+        return values
+    out = np.full_like(values, np.nan)
+    if periods < len(values):
+        out[periods:] = values[:len(values) - periods]
+    return out
+
+
+def _cross_above(a, b):
+    return (a > b) & (_prev(a) <= _prev(b))
+
+
+def _cross_below(a, b):
+    return (a < b) & (_prev(a) >= _prev(b))
+
+
+FUNCTIONS = {
+    'cross_above': (_cross_above, 2),
+    'cross_below': (_cross_below, 2),
+    'prev': (_prev, (1, 2)),
+}
+
+
+def _tokenize(text):
+    tokens = []
+    pos = 0
+    text = text.strip()
+    while pos < len(text):
+        match = _TOKEN_RE.match(text, pos)
+        if not match:
+            pos = len(text) - len(text[pos:].lstrip())
+            raise RuleError(f"Unexpected character {text[pos]!r} at position {pos} in rule: {text}")
+        pos = match.end()
+        kind = match.lastgroup
+        tokens.append((kind, match.group(kind)))
+    return tokens
+
+
+class _Parser:
+    """Recursive descent parser producing (evaluator, referenced columns)."""
+
+    def __init__(self, text):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.pos = 0
+        self.columns = set()
+        # Bars looked back by prev()/cross_*(), summed: an upper bound for nested calls
+        self.lookback = 0
+
+    def parse(self):
+        if not self.tokens:
+            raise RuleError("Empty rule")
+        node = self._or()
+        if self.pos != len(self.tokens):
+            raise RuleError(f"Unexpected token {self.tokens[self.pos][1]!r} in rule: {self.text}")
+        return node
+
+    def _peek(self):
+        return self.tokens[self.pos][1] if self.pos < len(self.tokens) else None
+
+    def _take(self, expected=None):
+        if self.pos >= len(self.tokens):
+            raise RuleError(f"Unexpected end of rule: {self.text}")
+        kind, value = self.tokens[self.pos]
+        if expected is not None and value != expected:
+            raise RuleError(f"Expected {expected!r} but found {value!r} in rule: {self.text}")
+        self.pos += 1
+        return kind, value
+
+    def _binary(self, operand, operators):
+        node = operand()
+        while self._peek() in operators:
+            _, op = self._take()
+            left, right, func = node, operand(), operators[op]
+            node = lambda cols, l=left, r=right, f=func: f(l(cols), r(cols))
+        return node
+
+    def _or(self):
+        return self._binary(self._and, {'|': np.logical_or})
+
+    def _and(self):
+        return self._binary(self._not, {'&': np.logical_and})
+
+    def _not(self):
+        if self._peek() == '~':
+            self._take()
+            inner = self._not()
+            return lambda cols: np.logical_not(inner(cols))
+        return self._comparison()
+
+    def _comparison(self):
+        node = self._sum()
+        if self._peek() in _COMPARISONS:
+            _, op = self._take()
+            left, right, func = node, self._sum(), _COMPARISONS[op]
+            node = lambda cols: func(left(cols), right(cols))
+        return node
+
+    def _sum(self):
+        return self._binary(self._product, {k: _ARITHMETIC[k] for k in '+-'})
+
+    def _product(self):
+        return self._binary(self._unary, {k: _ARITHMETIC[k] for k in '*/'})
+
+    def _unary(self):
+        if self._peek() == '-':
+            self._take()
+            inner = self._unary()
+            return lambda cols: np.negative(inner(cols))
+        return self._atom()
+
+    def _atom(self):
+        kind, value = self._take()
+
+        if kind == 'number':
+            constant = float(value)
+            node = lambda cols: constant
+            node.constant = constant
+            return node
+
+        if value == '(':
+            node = self._or()
+            self._take(')')
+            return node
+
+        if kind != 'name':
+            raise RuleError(f"Unexpected token {value!r} in rule: {self.text}")
+
+        if self._peek() == '(':
+            return self._call(value)
+
+        self.columns.add(value)
+        return lambda cols: cols[value]
+
+    def _call(self, name):
+        if name not in FUNCTIONS:
+            raise RuleError(f"Unknown function {name!r} in rule: {self.text}")
+        func, arity = FUNCTIONS[name]
+
+        self._take('(')
+        args = []
+        if self._peek() != ')':
+            args.append(self._or())
+            while self._peek() == ',':
+                self._take()
+                args.append(self._or())
+        self._take(')')
+
+        allowed = arity if isinstance(arity, tuple) else (arity,)
+        if len(args) not in allowed:
+            raise RuleError(f"{name}() takes {' or '.join(map(str, allowed))} arguments, got {len(args)}")
+
+        if name == 'prev' and len(args) == 2:
+            periods = getattr(args[1], 'constant', None)
+            if periods is None or periods < 0 or periods != int(periods):
+                raise RuleError(f"prev() periods must be a non-negative integer literal in rule: {self.text}")
+            periods = int(periods)
+            args[1] = lambda cols: periods
+            self.lookback += periods
+        else:
+            # cross_above/cross_below and prev(x) look one bar back
+            self.lookback += 1
+
+        return lambda cols: func(*(arg(cols) for arg in args))
+
+
+class Rule:
+    """
+    A compiled entry rule.
+    `columns` lists the indicator/price columns the rule references, so
+    only those need to be computed.
+    """
+
+    def __init__(self, expression):
+        self.expression = expression
+        parser = _Parser(expression)
+        self._evaluate = parser.parse()
+        self.columns = frozenset(parser.columns)
+        self.lookback = parser.lookback
+        self._check()
+
+    def __repr__(self):
+        return f"Rule({self.expression!r})"
+
+    def _check(self):
+        """Dry-run the rule on a few synthetic rows so evaluation errors surface as RuleError here."""
+        cols = {name: np.arange(1.0, 4.0) for name in self.columns}
+        try:
+            with np.errstate(all='ignore'):
+                result = np.asarray(self._evaluate(cols), dtype=bool)
+                np.broadcast_to(result, (3,))
+        except Exception as e:
+            raise RuleError(f"Rule cannot be evaluated ({type(e).__name__}: {e}): {self.expression}")
+
+    def evaluate(self, df):
+        """
+        Evaluate the rule on every row of `df`.
+        Returns a boolean NumPy array, False on rows where a referenced column
+        (or one of the bars prev()/cross_*() look back at) is NaN, e.g. indicator warm-up.
+        """
+        cols = _column_arrays(df, self.columns)
+        return self._evaluate_masked(cols, len(df))
+
+    def _evaluate_masked(self, cols, length):
+        result = np.broadcast_to(np.asarray(self._evaluate(cols), dtype=bool), (length,))
+        return result & self._valid_rows(cols, length)
+
+    def _valid_rows(self, cols, length):
+        """True where every referenced column is non-NaN on the row and the `lookback` rows before it."""
+        present = np.ones(length, dtype=bool)
+        for name in self.columns:
+            present &= ~np.isnan(cols[name])
+
+        valid = present.copy()
+        for k in range(1, min(self.lookback, length) + 1):
+            valid[k:] &= present[:-k]
+        valid[:min(self.lookback, length)] = False
+        return valid
+
+    def check_last(self, df):
+        """Evaluate the rule on the last row only (live scanning)."""
+        if df.empty:
+            return False
+        return bool(self.evaluate(df)[-1])
+
+
+class RuleSet:
+    """
+    Several named rules evaluated against the same data in one pass.
+    Indicators shared between rules are computed once.
+    """
+
+    def __init__(self, rules):
+        self.rules = {name: rule if isinstance(rule, Rule) else Rule(rule) for name, rule in rules.items()}
+        self.columns = frozenset().union(*(rule.columns for rule in self.rules.values()))
+
+    def evaluate(self, df):
+        """Return a DataFrame with one boolean column per rule, aligned to `df`."""
+        cols = _column_arrays(df, self.columns)
+        results = {}
+        for name, rule in self.rules.items():
+            results[name] = rule._evaluate_masked(cols, len(df))
+        return pd.DataFrame(results, index=df.index)
+
+
+def _column_arrays(df, columns):
+    """Resolve rule column names (e.g. 'macd_signal') to float arrays from `df`."""
+    arrays = {}
+    for name in columns:
+        source = Indicators.column_name(name)
+        if source not in df.columns:
+            raise KeyError(f"Column '{name}' is not in the dataframe; compute it with Indicators.add_indicators first")
+        arrays[name] = df[source].to_numpy(dtype=float, na_value=np.nan)
+    return arrays
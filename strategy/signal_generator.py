@@ -1,39 +1,83 @@
 import pandas as pd
 from crypto_bot.config import Config
+from crypto_bot.strategy.indicators import Indicators
+from crypto_bot.strategy.rules import Rule, RuleSet
+
+def _validate_entry_rule(settings):
+    """Settings validator: ENTRY_RULE must compile and only use columns Indicators can compute."""
+    expression = settings['ENTRY_RULE']
+    try:
+        rule = Rule(expression)
+    except ValueError as e:
+        raise ValueError(f"ENTRY_RULE={expression!r} ({e})")
+    unknown = [name for name in rule.columns if not Indicators.is_supported(name)]
+    if unknown:
+        raise ValueError(f"ENTRY_RULE={expression!r} (unknown columns {', '.join(sorted(unknown))})")
+    # An EMA longer than the fetched candles is never computed, so the rule could never fire
+    too_long = [name for name in rule.columns
+                if name.startswith('ema_') and int(name[len('ema_'):]) > settings['OHLCV_LIMIT']]
+    if too_long:
+        raise ValueError(f"ENTRY_RULE={expression!r} ({', '.join(sorted(too_long))} needs more candles than OHLCV_LIMIT={settings['OHLCV_LIMIT']})")
+
+Config.add_settings_validator(_validate_entry_rule)
 
 class SignalGenerator:
-    def check_entry_signal(self, df):
+    def __init__(self, rule=None):
         """
-        Check for Buy Signal:
+        `rule` is a rule expression (or compiled Rule); defaults to Config.ENTRY_RULE:
         1. Price > EMA 200 (Bullish Trend)
         2. EMA 10 Crosses Above EMA 55 (Momentum)
         3. MACD Line > Signal Line (Confirmation)
         """
-        if df.empty or len(df) < 200:
-            return None
-            
-        current = df.iloc[-1]
-        previous = df.iloc[-2]
-        
-        # 1. Trend Filter: Price > EMA 200
-        # Check if Close or High is above EMA 200. Usually Close.
-        if current['close'] <= current['ema_200']:
-            return None
-            
-        # 2. Momentum: EMA 10 Crosses EMA 55
-        # Current EMA 10 > EMA 55 AND Previous EMA 10 <= Previous EMA 55
-        ema_cross = (current['ema_10'] > current['ema_55']) and (previous['ema_10'] <= previous['ema_55'])
-        
-        if not ema_cross:
+        # Only a rule taken from Config follows settings reloads
+        self.uses_config_rule = rule is None
+        if rule is None:
+            rule = Config.ENTRY_RULE
+        self.rule = rule if isinstance(rule, Rule) else Rule(rule)
+
+    def on_config_change(self, changed):
+        """Recompile the entry rule if a reload changed it (e.g. new EMA lengths)."""
+        if self.uses_config_rule and 'ENTRY_RULE' in changed:
+            self.rule = Rule(Config.ENTRY_RULE)
+
+    @property
+    def required_columns(self):
+        """Indicator/price columns the entry rule references."""
+        return set(self.rule.columns)
+
+    def has_indicators(self, df):
+        """True if every column the rule needs was computed and is not all NaN."""
+        for name in self.rule.columns:
+            column = Indicators.column_name(name)
+            if column not in df.columns or df[column].isna().all():
+                return False
+        return True
+
+    def check_entry_signal(self, df):
+        """
+        Check for a Buy Signal on the latest candle.
+        Indicator warm-up is handled by the rule's NaN masking, as in scan_entry_signals.
+        """
+        if df.empty:
             return None
-            
-        # 3. MACD Confirmation
-        # MACD Line > Signal Line
-        # Need to dynamically find column names because pandas_ta names them with params
-        macd_col = [c for c in df.columns if c.startswith('MACD_') and not c.startswith('MACDs') and not c.startswith('MACDh')][0]
-        signal_col = [c for c in df.columns if c.startswith('MACDs_')][0]
-        
-        if current[macd_col] > current[signal_col]:
+
+        if self.rule.check_last(df):
             return 'BUY'
-            
+
         return None
+
+    def scan_entry_signals(self, df):
+        """
+        Evaluate the entry rule on every candle (for backtests).
+        Returns a boolean NumPy array aligned to `df`.
+        """
+        return self.rule.evaluate(df)
+
+    @staticmethod
+    def scan_strategies(df, strategies):
+        """
+        Evaluate several strategies ({name: rule expression}) in one pass.
+        Returns a DataFrame of boolean entry signals, one column per strategy.
+        """
+        rule_set = strategies if isinstance(strategies, RuleSet) else RuleSet(strategies)
+        return rule_set.evaluate(df)
@@ -1,19 +1,56 @@
+import numpy as np
 from crypto_bot.config import Config
-from crypto_bot.utils.helpers import calculate_trade_size
+from crypto_bot.utils.helpers import calculate_trade_sizes, apply_lot_limits
+
+# Field layout of the structured array returned by calculate_trade_params_batch
+TRADE_PARAMS_DTYPE = np.dtype([
+    ('entry_price', 'f8'),
+    ('stop_loss', 'f8'),
+    ('tp1', 'f8'),
+    ('tp2', 'f8'),
+    ('tp3', 'f8'),
+    ('size', 'f8'),
+    ('atr', 'f8'),
+])
 
 class TradeManager:
-    def calculate_trade_params(self, df, entry_price, capital):
+    def calculate_trade_params(self, df, entry_price, capital, limits=None):
         """
         Calculate Stop Loss, TPs, and Position Size.
+        `limits` are the market's lot limits (see MarketData.get_market_limits).
         Returns a dict of trade parameters.
         """
-        current_atr = df.iloc[-1]['atr']
+        current_atr = df['atr'].iat[-1]
+        
+        params = self.calculate_trade_params_batch([entry_price], [current_atr], capital, limits)[0]
+        
+        return {name: float(params[name]) for name in TRADE_PARAMS_DTYPE.names}
+
+    def calculate_trade_params_batch(self, entry_prices, atrs, capital, limits=None):
+        """
+        Vectorized trade parameters for many hypothetical entries at once.
+        `entry_prices` and `atrs` are arrays; `capital` and the `limits` values
+        (amount_step, min_amount, min_notional) may be scalars or arrays.
+        Returns a structured array with TRADE_PARAMS_DTYPE fields.
+        """
+        entry_prices = np.asarray(entry_prices, dtype=float)
+        atrs = np.asarray(atrs, dtype=float)
         
         # SL = Entry - (ATR * 2)
-        stop_loss = entry_price - (current_atr * Config.ATR_MULTIPLIER)
+        stop_loss = entry_prices - (atrs * Config.ATR_MULTIPLIER)
         
         # Risk Calculation
-        trade_size = calculate_trade_size(capital, Config.RISK_PER_TRADE_PERCENT, entry_price, stop_loss)
+        sizes = calculate_trade_sizes(capital, Config.RISK_PER_TRADE_PERCENT, entry_prices, stop_loss)
+        
+        # Exchange lot size / min notional
+        if limits:
+            sizes = apply_lot_limits(
+                sizes,
+                entry_prices,
+                amount_step=limits.get('amount_step'),
+                min_amount=limits.get('min_amount'),
+                min_notional=limits.get('min_notional'),
+            )
         
         # Take Profits (Risk:Reward based or Fixed? User said: "TP1 -> 33% of position")
         # Usually TP levels are distance based or RR based. User didn't specify RR, 
@@ -29,18 +66,15 @@ class TradeManager:
         # Since SL is 2*ATR, 1R would be 2*ATR distance.
         # Let's set TP1 = 1R (2*ATR), TP2 = 1.5R, TP3 = 2R.
         
-        risk_distance = entry_price - stop_loss
-        
-        tp1 = entry_price + risk_distance      # 1:1 Risk Reward
-        tp2 = entry_price + (risk_distance * 1.5)
-        tp3 = entry_price + (risk_distance * 2.0) # Or just let it ride? User has fixed 3 TPs.
-        
-        return {
-            'entry_price': entry_price,
-            'stop_loss': stop_loss,
-            'tp1': tp1,
-            'tp2': tp2,
-            'tp3': tp3,
-            'size': trade_size,
-            'atr': current_atr
-        }
+        risk_distance = entry_prices - stop_loss
+        
+        params = np.empty(np.broadcast(entry_prices, sizes).shape, dtype=TRADE_PARAMS_DTYPE)
+        params['entry_price'] = entry_prices
+        params['stop_loss'] = stop_loss
+        params['tp1'] = entry_prices + risk_distance          # 1:1 Risk Reward
+        params['tp2'] = entry_prices + (risk_distance * 1.5)
+        params['tp3'] = entry_prices + (risk_distance * 2.0)  # Or just let it ride? User has fixed 3 TPs.
+        params['size'] = sizes
+        params['atr'] = atrs
+        
+        return params
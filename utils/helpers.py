@@ -1,3 +1,5 @@
+import numpy as np
+
 def calculate_trade_size(capital, risk_percent, entry_price, stop_loss_price):
     """
     Calculate trade size based on risk amount.
@@ -15,5 +17,44 @@ def calculate_trade_size(capital, risk_percent, entry_price, stop_loss_price):
     size = risk_amount / price_diff
     return size
 
+def calculate_trade_sizes(capital, risk_percent, entry_prices, stop_loss_prices):
+    """
+    Vectorized calculate_trade_size over arrays of entries/stops.
+    `capital` may be a scalar or an array. Invalid rows (stop >= entry, NaN) get 0.
+    """
+    entry_prices = np.asarray(entry_prices, dtype=float)
+    stop_loss_prices = np.asarray(stop_loss_prices, dtype=float)
+    
+    risk_amount = np.asarray(capital, dtype=float) * risk_percent
+    price_diff = entry_prices - stop_loss_prices
+    
+    valid = price_diff > 0
+    sizes = np.divide(risk_amount, price_diff, out=np.zeros(np.broadcast(risk_amount, price_diff).shape), where=valid)
+    return sizes
+
+def apply_lot_limits(sizes, prices, amount_step=None, min_amount=None, min_notional=None):
+    """
+    Round sizes down to the exchange lot step and zero out orders below
+    the minimum amount or minimum notional (size * price).
+    Limits may be scalars, arrays or None (no limit).
+    """
+    sizes = np.asarray(sizes, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    
+    if amount_step is not None:
+        step = np.asarray(amount_step, dtype=float)
+        has_step = step > 0
+        # Small epsilon so e.g. 0.3 / 0.1 does not floor to 2
+        steps = np.divide(sizes, step, out=np.zeros(np.broadcast(sizes, step).shape), where=has_step)
+        sizes = np.where(has_step, np.floor(steps + 1e-9) * step, sizes)
+    
+    too_small = np.zeros(sizes.shape, dtype=bool)
+    if min_amount is not None:
+        too_small |= sizes < np.asarray(min_amount, dtype=float)
+    if min_notional is not None:
+        too_small |= sizes * prices < np.asarray(min_notional, dtype=float)
+    
+    return np.where(too_small, 0.0, sizes)
+
 def format_currency(value):
     return f"${value:.2f}"